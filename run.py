@@ -1,6 +1,7 @@
 if __name__ == "__main__":
     import uvicorn
     from src.config.manager import settings
+    from src.utilities.server import select_event_loop, select_http_protocol
     uvicorn.run(
         app="src.main:backend_app",
         host=settings.SERVER_HOST,
@@ -8,4 +9,8 @@ if __name__ == "__main__":
         reload=settings.DEBUG,
         workers=settings.SERVER_WORKERS,
         log_level=settings.LOGGING_LEVEL,
+        loop=select_event_loop(),
+        http=select_http_protocol(),
+        limit_concurrency=2048,
+        backlog=4096,
     )
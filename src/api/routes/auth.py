@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Body
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr
 
 from src.api.dependencies.repository import get_repository
@@ -28,7 +29,7 @@ from src.utilities.logging.logger import logger
 from src.models.schemas.user import UserInLogin, UserInCreate
 from src.models.db.user import UserTypeEnum
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(prefix="/auth", tags=["authentication"], default_response_class=ORJSONResponse)
 
 @router.post("/register", response_model=JWTResponse)
 async def register(
@@ -44,13 +45,14 @@ async def register(
         if register_data.role.lower() == "farmer":
             user_type = UserTypeEnum.FARMER
 
-        # Check if username or email already exists
-        try:
-            await user_repo.is_username_taken(register_data.username)
-            await user_repo.is_email_taken(register_data.email)
-        except EntityAlreadyExists as e:
-            logger.error(f"User validation error: {str(e)}")
-            raise e
+        # Check if username or email already exists in a single round-trip
+        is_username_taken, is_email_taken = await user_repo.check_username_or_email_taken(
+            username=register_data.username, email=register_data.email
+        )
+        if is_username_taken:
+            raise EntityAlreadyExists(f"The username `{register_data.username}` is already taken!")
+        if is_email_taken:
+            raise EntityAlreadyExists(f"The email `{register_data.email}` is already registered!")
 
         # Create user model for database
         user_create = UserInCreate(
@@ -67,7 +69,7 @@ async def register(
         # Assuming you might want to add a way to store this in future
         
         # Get device info from request and client data
-        print("Register data:", register_data)
+        logger.debug(f"Register request from device {register_data.device_id} for {register_data.username}")
         device_info = get_device_info(request, register_data.device_id, register_data.client_data)
         
         # Calculate token expiration time
@@ -79,22 +81,14 @@ async def register(
         # Generate a refresh token if configured
         refresh_token, refresh_token_expires_in, _ = jwt_generator.generate_refresh_token(new_user, device_info)
 
-        # Store refresh token
-        await jwt_repo.create_jwt_record(
-            jwt=refresh_token,
-            user_id=new_user.id,
-            device_info=device_info,
-            token_type="refresh",
-            expires_in=refresh_token_expires_in
-        )
-        
-        # Store access token in database with device info
-        await jwt_repo.create_jwt_record(
-            jwt=access_token,
+        # Store both tokens with a single device lookup and commit
+        await jwt_repo.create_jwt_pair(
+            refresh_token=refresh_token,
+            access_token=access_token,
             user_id=new_user.id,
             device_info=device_info,
-            token_type="access",
-            expires_in=expiration_time
+            refresh_expires_in=refresh_token_expires_in,
+            access_expires_in=expiration_time
         )
         
         # Log successful registration
@@ -123,7 +117,7 @@ async def register(
         raise e
 
 
-@router.post("/login", response_model=JWTResponse)
+@router.post("/login", responses={status.HTTP_200_OK: {"model": JWTResponse}})
 async def login(
     request: Request,
     login_data: LoginRequest,
@@ -132,7 +126,7 @@ async def login(
 ):
     """Login endpoint that supports device-based authentication with enhanced device information"""
     try:
-        print(f"Login data: {request.json()}")
+        logger.debug(f"Login request from device {login_data.device_id} for {login_data.username}")
         # Authenticate user
         user_login = UserInLogin(
             username=login_data.username,
@@ -185,36 +179,35 @@ async def login(
             refresh_token, _, _ = jwt_generator.generate_refresh_token(user, device_info)
             refresh_expiry = settings.JWT_REFRESH_TOKEN_EXPIRATION_TIME * 24 * 60 * 60  # Convert days to seconds
             
-            # Store refresh token
+            # Store both tokens with a single device lookup and commit
+            await jwt_repo.create_jwt_pair(
+                refresh_token=refresh_token,
+                access_token=access_token,
+                user_id=user.id,
+                device_info=device_info,
+                refresh_expires_in=refresh_expiry,
+                access_expires_in=expiration_time
+            )
+        else:
+            # Store access token in database with device info
             await jwt_repo.create_jwt_record(
-                jwt=refresh_token,
+                jwt=access_token,
                 user_id=user.id,
                 device_info=device_info,
-                token_type="refresh",
-                expires_in=refresh_expiry
+                token_type="access",
+                expires_in=expiration_time
             )
         
-        # Store access token in database with device info
-        await jwt_repo.create_jwt_record(
-            jwt=access_token,
-            user_id=user.id,
-            device_info=device_info,
-            token_type="access",
-            expires_in=expiration_time
-        )
-        
-        # Return response with tokens
+        # Return response with tokens, already serialized so FastAPI skips response_model validation
         response = JWTResponse(
             access_token=access_token,
             token_type="bearer",
             expires_in=expires_in,
-            device_id=device_id
+            device_id=device_id,
+            refresh_token=refresh_token
         )
-        
-        if refresh_token:
-            response.refresh_token = refresh_token
             
-        return response
+        return ORJSONResponse(content=response.model_dump(mode="json"))
         
     except SecurityException as security_error:
         logger.warning(f"Security exception during login: {str(security_error)}")
@@ -250,31 +243,32 @@ async def refresh_token(
         
         # Get the token record
         token_record = await jwt_repo.get_token_record(refresh_token)
-        if not token_record or token_record.token_type != "refresh":
+        if not token_record or token_record.token_type != "refresh" or token_record.device is None:
             raise SecurityException("Invalid refresh token")
         
         # Get user
         user_id = token_data.get("user_id")
         user = await user_repo.read_user_by_id(id=user_id)
         
-        # Get device info from the refresh token record
+        # Get device info from the refresh token's device
+        device = token_record.device
         device_info = DeviceInfo(
-            device_id=token_record.device_id,
-            device_name=token_record.device_name,
-            device_type=token_record.device_type,
-            ip_address=token_record.ip_address,
-            user_agent=token_record.user_agent,
-            manufacturer=token_record.manufacturer,
-            model=token_record.model,
-            os_version=token_record.os_version,
-            app_version=token_record.app_version,
-            screen_resolution=token_record.screen_resolution,
-            network_type=token_record.network_type,
-            device_language=token_record.device_language,
-            battery_level=token_record.battery_level,
-            is_rooted=token_record.is_rooted,
-            android_id=token_record.android_id,
-            device_hash=token_record.device_hash,
+            device_id=device.device_id,
+            device_name=device.device_name,
+            device_type=device.device_type,
+            ip_address=device.ip_address,
+            user_agent=device.user_agent,
+            manufacturer=device.manufacturer,
+            model=device.model,
+            os_version=device.os_version,
+            app_version=device.app_version,
+            screen_resolution=device.screen_resolution,
+            network_type=device.network_type,
+            device_language=device.device_language,
+            battery_level=device.battery_level,
+            is_rooted=device.is_rooted,
+            android_id=device.android_id,
+            device_hash=device.device_hash,
         )
         
         # Generate new access token
@@ -1,12 +1,14 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Response, status
 
 from src.api.dependencies.auth import consumer_or_farmer_required 
 from src.api.dependencies.repository import get_repository
+from src.cache.redis import redis_manager
 from src.external.gov.client import DataGovClient
 from src.models.schemas.mandi import MandiPriceResponse
 from src.models.db.user import User, UserTypeEnum
 from src.utilities.logging.logger import logger
+from src.utilities.singleflight import run_once
 
 router = APIRouter(
     prefix="/mandi",
@@ -14,8 +16,11 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Seconds to serve an identical mandi price query from Redis before asking data.gov again
+MANDI_TTL = 60
 
-@router.get("/prices", response_model=MandiPriceResponse)
+
+@router.get("/prices", responses={status.HTTP_200_OK: {"model": MandiPriceResponse}})
 async def get_mandi_prices(
     current_user: User = Depends(consumer_or_farmer_required),
     format: str = Query("json", description="Output format (json, xml, or csv)"),
@@ -30,24 +35,55 @@ async def get_mandi_prices(
 ):
     """
     Get current daily price of various commodities from various markets (Mandi).
+
+    The response is validated and encoded once with pydantic-core, and those JSON bytes are what
+    gets cached and returned, so neither a hit nor a miss goes through FastAPI's response encoding.
     """
+    # build_key drops falsy parts, so name every part to keep offset=0 and empty filters distinct
+    cache_key = redis_manager.build_key(
+        "mandi",
+        # Version of the cached payload: v2 entries hold encoded response bytes, v1 held decoded dicts
+        "v2",
+        f"format={format}",
+        f"offset={offset}",
+        f"limit={limit}",
+        f"state={state or ''}",
+        f"district={district or ''}",
+        f"market={market or ''}",
+        f"commodity={commodity or ''}",
+        f"variety={variety or ''}",
+        f"grade={grade or ''}",
+    )
+    cached = await redis_manager.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    async def fetch_mandi_prices() -> bytes:
+        client = DataGovClient.instance()
+        response = await client.get_mandi_prices(
+            format=format,
+            offset=offset,
+            limit=limit,
+            state=state,
+            district=district,
+            market=market,
+            commodity=commodity,
+            variety=variety,
+            grade=grade,
+            # Redis below is the only cache for this route, so MANDI_TTL is what decides freshness
+            cache_ttl=0,
+        )
+        content = MandiPriceResponse.model_validate(response).model_dump_json().encode("utf-8")
+        await redis_manager.set(cache_key, content, expiration=MANDI_TTL)
+        return content
+
     try:
-        async with DataGovClient() as client:
-            response = await client.get_mandi_prices(
-                format=format,
-                offset=offset,
-                limit=limit,
-                state=state,
-                district=district,
-                market=market,
-                commodity=commodity,
-                variety=variety,
-                grade=grade
-            )
-            return response
+        # Concurrent misses for the same filters share a single upstream call
+        content = await run_once(cache_key, fetch_mandi_prices)
     except Exception as e:
         logger.error(f"Error fetching mandi prices: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch mandi prices: {str(e)}"
-        )
\ No newline at end of file
+        )
+    return Response(content=content, media_type="application/json")
@@ -1,12 +1,14 @@
 import uuid
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, status, Request, HTTPException
+from fastapi.responses import ORJSONResponse
 import pydantic
 
 from src.api.dependencies.repository import get_repository
 from src.models.db.user import UserTypeEnum
 from src.models.schemas.user import UserInResponse, UserInUpdate, UserWithToken
 from src.repository.crud.user import UserCRUDRepository
-from src.securities.authorizations.jwt import jwt_generator
+from src.securities.authorizations.jwt_cache import get_cached_access_token
 from src.utilities.exceptions.database import EntityDoesNotExist
 from src.utilities.exceptions.http.exc_404 import (
     http_404_exc_email_not_found_request,
@@ -17,7 +19,42 @@ from src.api.dependencies.auth import oauth2_scheme, verify_token
 from src.repository.crud.jwt import JwtRecordCRUDRepository
 from src.utilities.logging.logger import logger
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], default_response_class=ORJSONResponse)
+
+# Serialized get_users entries, keyed by (user id, last change timestamp)
+USER_RESPONSE_CACHE_TTL: int = 60
+USER_RESPONSE_CACHE_MAXSIZE: int = 50_000
+
+_user_response_cache: TTLCache = TTLCache(maxsize=USER_RESPONSE_CACHE_MAXSIZE, ttl=USER_RESPONSE_CACHE_TTL)
+
+
+def _build_user_response(db_user) -> dict:
+    """
+    Return the JSON-ready `UserInResponse` for a user row, building it only on a cache miss.
+    """
+    # Key on the full timestamp so two updates within the same second still get distinct entries
+    cache_key = (db_user.id, db_user.updated_at or db_user.created_at)
+
+    user_response = _user_response_cache.get(cache_key)
+    if user_response is None:
+        # Rows come straight from the database, so skip per-row validation
+        user_response = UserInResponse.model_construct(
+            id=db_user.id,
+            authorized_user=UserWithToken.model_construct(
+                token=get_cached_access_token(user=db_user),
+                username=db_user.username,
+                email=db_user.email,
+                user_type=db_user.user_type,
+                is_verified=db_user.is_verified,
+                is_active=db_user.is_active,
+                is_logged_in=db_user.is_logged_in,
+                created_at=db_user.created_at,
+                updated_at=db_user.updated_at,
+            ),
+        ).model_dump(mode="json", by_alias=True)
+        _user_response_cache[cache_key] = user_response
+
+    return user_response
 
 # Add new /me endpoint
 @router.get(
@@ -71,34 +108,18 @@ async def get_current_user(
 @router.get(
     path="",
     name="users:read-users",
-    response_model=list[UserInResponse],
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": list[UserInResponse]}},
 )
 async def get_users(
     user_repo: UserCRUDRepository = Depends(get_repository(repo_type=UserCRUDRepository)),
-) -> list[UserInResponse]:
+) -> ORJSONResponse:
     db_users = await user_repo.read_users()
-    db_user_list: list = list()
 
-    for db_user in db_users:
-        access_token = jwt_generator.generate_access_token(user=db_user)
-        user = UserInResponse(
-            id=db_user.id,
-            authorized_user=UserWithToken(
-                token=access_token,
-                username=db_user.username,
-                email=db_user.email,  # type: ignore
-                user_type=db_user.user_type,
-                is_verified=db_user.is_verified,
-                is_active=db_user.is_active,
-                is_logged_in=db_user.is_logged_in,
-                created_at=db_user.created_at,
-                updated_at=db_user.updated_at,
-            ),
-        )
-        db_user_list.append(user)
+    # Entries are already JSON-ready dicts, so FastAPI's response_model pass is skipped as well
+    db_user_list = [_build_user_response(db_user=db_user) for db_user in db_users]
 
-    return db_user_list
+    return ORJSONResponse(content=db_user_list)
 
 
 @router.get(
@@ -113,7 +134,7 @@ async def get_user(
 ) -> UserInResponse:
     try:
         db_user = await user_repo.read_user_by_id(id=id)
-        access_token = jwt_generator.generate_access_token(user=db_user)
+        access_token = get_cached_access_token(user=db_user)
 
     except EntityDoesNotExist:
         raise await http_404_exc_id_not_found_request(id=id)
@@ -160,7 +181,7 @@ async def update_user(
     except EntityDoesNotExist:
         raise await http_404_exc_id_not_found_request(id=query_id)
 
-    access_token = jwt_generator.generate_access_token(user=updated_db_user)
+    access_token = get_cached_access_token(user=updated_db_user)
 
     return UserInResponse(
         id=updated_db_user.id,
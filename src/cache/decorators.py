@@ -35,8 +35,9 @@ def cached(
         # Get the function's signature
         sig = inspect.signature(func)
         
-        # Determine if function is async
-        is_async = inspect.iscoroutinefunction(func)
+        # Redis calls are awaited, so only coroutine functions can be cached
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"@cached requires an async function, got {func.__qualname__}")
         
         # Figure out the prefix to use
         prefix = key_prefix or f"{func.__module__}.{func.__qualname__}"
@@ -61,7 +62,7 @@ def cached(
             cache_key = redis_manager.build_key(prefix, key_hash)
             
             # Try to get from cache
-            cached_result = redis_manager.get(cache_key)
+            cached_result = await redis_manager.get(cache_key)
             if cached_result is not None:
                 logger.debug(f"Cache hit for {func.__name__}({key_data})")
                 return cached_result
@@ -71,43 +72,10 @@ def cached(
             result = await func(*args, **kwargs)
             
             # Cache the result
-            redis_manager.set(cache_key, result, expiration=ttl)
+            await redis_manager.set(cache_key, result, expiration=ttl)
             return result
         
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            # Build a dict of all provided args and kwargs
-            call_args = {}
-            
-            # Match the positional arguments to their parameter names
-            parameters = list(sig.parameters.values())
-            for i, arg in enumerate(args):
-                if i < len(parameters):
-                    call_args[parameters[i].name] = arg
-            
-            # Add the keyword arguments
-            call_args.update({k: v for k, v in kwargs.items() if k not in skip_kwargs})
-            
-            # Generate a cache key
-            key_data = json.dumps(call_args, sort_keys=True)
-            key_hash = hashlib.md5(key_data.encode()).hexdigest()
-            cache_key = redis_manager.build_key(prefix, key_hash)
-            
-            # Try to get from cache
-            cached_result = redis_manager.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for {func.__name__}({key_data})")
-                return cached_result
-            
-            # Not in cache, call the original function
-            logger.debug(f"Cache miss for {func.__name__}({key_data})")
-            result = func(*args, **kwargs)
-            
-            # Cache the result
-            redis_manager.set(cache_key, result, expiration=ttl)
-            return result
-        
-        return async_wrapper if is_async else sync_wrapper
+        return async_wrapper
     
     return decorator
 
@@ -165,7 +133,7 @@ def cache_endpoint(
             cache_key = key_fn(request)
             
             # Try to get from cache
-            cached_response = redis_manager.get(cache_key)
+            cached_response = await redis_manager.get(cache_key)
             if cached_response is not None:
                 logger.debug(f"Cache hit for endpoint {request.url.path}")
                 # Parse the cached response
@@ -187,7 +155,7 @@ def cache_endpoint(
                     "headers": dict(response.headers),
                     "media_type": response.media_type
                 }
-                redis_manager.set(cache_key, response_data, expiration=ttl)
+                await redis_manager.set(cache_key, response_data, expiration=ttl)
             
             return response
         
@@ -206,7 +174,8 @@ def invalidate_cache(key_prefix: str):
         Decorated function that will invalidate cache entries with the given prefix.
     """
     def decorator(func):
-        is_async = inspect.iscoroutinefunction(func)
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"@invalidate_cache requires an async function, got {func.__qualname__}")
         
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
@@ -215,31 +184,15 @@ def invalidate_cache(key_prefix: str):
             # Find all keys with the prefix
             pattern = f"{key_prefix}*"
             try:
-                keys = redis_manager.client.keys(pattern)
-                if keys:
-                    redis_manager.client.delete(*keys)
-                    logger.debug(f"Invalidated {len(keys)} cache entries with prefix {key_prefix}")
-            except Exception as e:
-                logger.error(f"Error invalidating cache with prefix {key_prefix}: {str(e)}")
-                
-            return result
-        
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            result = func(*args, **kwargs)
-            
-            # Find all keys with the prefix
-            pattern = f"{key_prefix}*"
-            try:
-                keys = redis_manager.client.keys(pattern)
+                keys = [key async for key in redis_manager.client.scan_iter(match=pattern)]
                 if keys:
-                    redis_manager.client.delete(*keys)
+                    await redis_manager.client.delete(*keys)
                     logger.debug(f"Invalidated {len(keys)} cache entries with prefix {key_prefix}")
             except Exception as e:
                 logger.error(f"Error invalidating cache with prefix {key_prefix}: {str(e)}")
                 
             return result
         
-        return async_wrapper if is_async else sync_wrapper
+        return async_wrapper
     
     return decorator
\ No newline at end of file
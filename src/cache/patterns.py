@@ -5,6 +5,7 @@ This module provides common caching patterns and utilities for the application.
 """
 
 import time
+import inspect
 import typing
 import functools
 from src.cache.redis import redis_manager
@@ -20,17 +21,20 @@ def memoize(ttl: int = None):
         ttl: Time to live for cache entries in seconds
     """
     def decorator(func):
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"@memoize requires an async function, got {func.__qualname__}")
+        
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        async def wrapper(*args, **kwargs):
             # Generate a simple key based on function name and arguments
             cache_key = f"memoize:{func.__name__}:{str(args)}:{str(kwargs)}"
-            result = redis_manager.get(cache_key)
+            result = await redis_manager.get(cache_key)
             
             if result is not None:
                 return result
                 
-            result = func(*args, **kwargs)
-            redis_manager.set(cache_key, result, expiration=ttl)
+            result = await func(*args, **kwargs)
+            await redis_manager.set(cache_key, result, expiration=ttl)
             return result
             
         return wrapper
@@ -68,8 +72,8 @@ def rate_limit(
             client_key = key_func(request)
             rate_key = f"ratelimit:{func.__name__}:{client_key}"
             
-            # Get current count
-            count = redis_manager.get(rate_key, 0)
+            # Get current count (INCR stores a bare integer, so read it from the raw client)
+            count = int(await redis_manager.client.get(rate_key) or 0)
             
             # Check if limit has been reached
             if count >= limit:
@@ -81,11 +85,11 @@ def rate_limit(
                 )
                 
             # Increment count
-            pipe = redis_manager.client.pipeline()
+            pipe = redis_manager.client.pipeline(transaction=False)
             pipe.incr(rate_key)
             # Set expiration if not already set
             pipe.expire(rate_key, period)
-            pipe.execute()
+            await pipe.execute()
             
             # Call the original function
             return await func(request, *args, **kwargs)
@@ -93,7 +97,7 @@ def rate_limit(
         return wrapper
     return decorator
 
-def cache_data(key: str, data: typing.Any, ttl: int = None) -> bool:
+async def cache_data(key: str, data: typing.Any, ttl: int = None) -> bool:
     """
     Utility function to manually cache data.
     
@@ -105,9 +109,9 @@ def cache_data(key: str, data: typing.Any, ttl: int = None) -> bool:
     Returns:
         True if data was cached successfully, False otherwise
     """
-    return redis_manager.set(key, data, expiration=ttl)
+    return await redis_manager.set(key, data, expiration=ttl)
 
-def get_cached_data(key: str, default: typing.Any = None) -> typing.Any:
+async def get_cached_data(key: str, default: typing.Any = None) -> typing.Any:
     """
     Utility function to manually retrieve cached data.
     
@@ -118,9 +122,9 @@ def get_cached_data(key: str, default: typing.Any = None) -> typing.Any:
     Returns:
         Cached data or default value
     """
-    return redis_manager.get(key, default)
+    return await redis_manager.get(key, default)
 
-def invalidate_data(key: str) -> bool:
+async def invalidate_data(key: str) -> bool:
     """
     Utility function to manually invalidate cached data.
     
@@ -130,9 +134,9 @@ def invalidate_data(key: str) -> bool:
     Returns:
         True if data was invalidated successfully, False otherwise
     """
-    return redis_manager.delete(key)
+    return await redis_manager.delete(key)
 
-def cache_with_fallback(
+async def cache_with_fallback(
     key: str,
     fallback_func: typing.Callable,
     ttl: int = None,
@@ -145,7 +149,7 @@ def cache_with_fallback(
     
     Args:
         key: Cache key
-        fallback_func: Function to call if cache miss
+        fallback_func: Function or coroutine function to call if cache miss
         ttl: Cache TTL in seconds
         stale_ttl: How long to keep stale data after expiration
         
@@ -153,23 +157,25 @@ def cache_with_fallback(
         Cached data or result of fallback function
     """
     # Try to get fresh data from cache
-    data = redis_manager.get(key)
+    data = await redis_manager.get(key)
     if data is not None:
         return data
         
     # Try to get stale data as backup
     stale_key = f"{key}:stale"
-    stale_data = redis_manager.get(stale_key)
+    stale_data = await redis_manager.get(stale_key)
     
     try:
         # Call fallback function to get fresh data
         fresh_data = fallback_func()
+        if inspect.isawaitable(fresh_data):
+            fresh_data = await fresh_data
         
         # Cache the fresh data
-        redis_manager.set(key, fresh_data, expiration=ttl)
+        await redis_manager.set(key, fresh_data, expiration=ttl)
         
         # Also cache as stale data with longer TTL for fallback
-        redis_manager.set(stale_key, fresh_data, expiration=stale_ttl)
+        await redis_manager.set(stale_key, fresh_data, expiration=stale_ttl)
         
         return fresh_data
     except Exception as e:
@@ -5,13 +5,22 @@ This module provides a Redis connection manager for handling Redis client operat
 and connection lifecycle.
 """
 
-import json
 import typing
+import orjson
 import redis
+from redis import asyncio as aioredis
+from cachetools import TTLCache
 from functools import wraps
 from src.config.manager import settings
 from src.utilities.logging.logger import logger
 
+# Type tags for stored values. They start with a NUL byte so untagged values written before the
+# tags existed (plain text or JSON) can never be mistaken for tagged ones.
+JSON_TAG = b'\x00\x01J'
+STR_TAG = b'\x00\x01S'
+_JSON_TAG_TEXT = JSON_TAG.decode('ascii')
+_STR_TAG_TEXT = STR_TAG.decode('ascii')
+
 class RedisManager:
     """
     Redis connection manager for handling Redis client operations.
@@ -23,11 +32,24 @@ class RedisManager:
     
     _instance = None
     
+    # In-process (L1) cache of raw payloads in front of Redis for keys read with cacheable=True
+    L1_CACHE_MAXSIZE = 4096
+    L1_CACHE_TTL = 5
+    
+    # SET every KEYS[i] to ARGV[i] with the shared TTL (milliseconds) passed as the last ARGV
+    SET_MANY_SCRIPT = """
+for i = 1, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[i], 'PX', ARGV[#ARGV])
+end
+return #KEYS
+"""
+    
     def __new__(cls):
         """Singleton pattern to ensure only one Redis connection manager exists."""
         if cls._instance is None:
             cls._instance = super(RedisManager, cls).__new__(cls)
             cls._instance._client = None
+            cls._instance._l1 = TTLCache(maxsize=cls.L1_CACHE_MAXSIZE, ttl=cls.L1_CACHE_TTL)
         return cls._instance
     
     def __init__(self):
@@ -37,49 +59,86 @@ class RedisManager:
             self._setup_redis_client()
     
     def _setup_redis_client(self):
-        """Set up the Redis client with configuration from settings."""
-        try:
-            logger.info(f"Connecting to Redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}")
-            self._client = redis.Redis(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=settings.REDIS_DB,
-                username=settings.REDIS_USERNAME,
-                password=settings.REDIS_PASSWORD,
-                decode_responses=settings.REDIS_DECODE_RESPONSES
-            )
-            # Test the connection
-            self._client.ping()
-            logger.info(f"Connected to Redis successfully")
-        except redis.ConnectionError as e:
-            logger.error(f"Failed to connect to Redis: {str(e)}")
-            self._client = None
+        """
+        Set up the Redis client with configuration from settings.
+
+        The asyncio client connects lazily from its pool, so connection errors
+        surface on the first command rather than here.
+        """
+        logger.info(f"Creating Redis client for {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+        self._client = aioredis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            username=settings.REDIS_USERNAME,
+            password=settings.REDIS_PASSWORD,
+            decode_responses=settings.REDIS_DECODE_RESPONSES
+        )
+        self._set_many_script = self._client.register_script(self.SET_MANY_SCRIPT)
     
     @property
-    def client(self) -> redis.Redis:
+    def client(self) -> aioredis.Redis:
         """
         Get the Redis client instance.
         
         Returns:
-            redis.Redis: The Redis client instance.
-            
-        Raises:
-            ConnectionError: If the Redis client is not connected.
+            redis.asyncio.Redis: The Redis client instance.
         """
         if self._client is None:
             self._setup_redis_client()
-            if self._client is None:
-                raise ConnectionError("Redis client is not connected")
         return self._client
     
     async def close(self):
         """Close the Redis connection."""
         if self._client:
             logger.info("Closing Redis connection")
-            self._client.close()
+            await self._client.aclose()
             self._client = None
-    
-    def set(self, key: str, value: typing.Any, expiration: int = None) -> bool:
+
+    def _serialize(self, value: typing.Any) -> bytes:
+        """
+        Serialize a value for storage, prefixed with a type tag.
+
+        Args:
+            value: The value to serialize.
+
+        Returns:
+            bytes: STR_TAG followed by the raw string/bytes, or JSON_TAG followed by the orjson payload.
+        """
+        if isinstance(value, bytes):
+            return STR_TAG + value
+        if isinstance(value, str):
+            return STR_TAG + value.encode('utf-8')
+        return JSON_TAG + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def _deserialize(self, value: typing.Union[str, bytes]) -> typing.Any:
+        """
+        Deserialize a value written by _serialize.
+
+        Args:
+            value: The raw value from Redis (str when decode_responses is enabled).
+
+        Returns:
+            The decoded value. Untagged values written before the type tag existed are read the way
+            they used to be: JSON objects and arrays are decoded, anything else is returned unchanged.
+        """
+        if isinstance(value, str):
+            json_tag, str_tag, legacy_json_starts = _JSON_TAG_TEXT, _STR_TAG_TEXT, ('{', '[')
+        else:
+            json_tag, str_tag, legacy_json_starts = JSON_TAG, STR_TAG, (b'{', b'[')
+
+        if value.startswith(json_tag):
+            return orjson.loads(value[len(json_tag):])
+        if value.startswith(str_tag):
+            return value[len(str_tag):]
+        if value.startswith(legacy_json_starts):
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+        return value
+
+    async def set(self, key: str, value: typing.Any, expiration: int = None) -> bool:
         """
         Set a key-value pair in Redis with optional expiration.
         
@@ -92,48 +151,48 @@ class RedisManager:
             bool: True if the key was set, False otherwise.
         """
         try:
-            # Serialize non-string values to JSON
-            if not isinstance(value, (str, bytes)):
-                value = json.dumps(value)
+            value = self._serialize(value)
                 
             # Use default expiration from settings if not specified
             if expiration is None:
                 expiration = settings.REDIS_CACHE_EXPIRATION
                 
-            return self.client.set(key, value, ex=expiration)
+            self._l1.pop(key, None)
+            return await self.client.set(key, value, ex=expiration)
         except (redis.RedisError, ConnectionError) as e:
             logger.error(f"Redis set error for key '{key}': {str(e)}")
             return False
     
-    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+    async def get(self, key: str, default: typing.Any = None, cacheable: bool = False) -> typing.Any:
         """
         Get a value from Redis by key.
         
         Args:
             key: The key to get.
             default: The default value to return if the key doesn't exist.
+            cacheable: Serve repeated reads from the in-process L1 cache for a few seconds.
+                Only use this for read-mostly keys that can tolerate brief staleness.
+                L1 keeps the stored payload and decodes it on every hit, so callers never share objects.
             
         Returns:
             The value from Redis, or the default value if the key doesn't exist.
         """
+        if cacheable and key in self._l1:
+            return self._deserialize(self._l1[key])
+            
         try:
-            value = self.client.get(key)
+            value = await self.client.get(key)
             if value is None:
                 return default
                 
-            # Try to deserialize from JSON if it looks like JSON
-            if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    pass
-                    
-            return value
+            if cacheable:
+                self._l1[key] = value
+            return self._deserialize(value)
         except (redis.RedisError, ConnectionError) as e:
             logger.error(f"Redis get error for key '{key}': {str(e)}")
             return default
     
-    def delete(self, key: str) -> bool:
+    async def delete(self, key: str) -> bool:
         """
         Delete a key from Redis.
         
@@ -143,13 +202,14 @@ class RedisManager:
         Returns:
             bool: True if the key was deleted, False otherwise.
         """
+        self._l1.pop(key, None)
         try:
-            return bool(self.client.delete(key))
+            return bool(await self.client.delete(key))
         except (redis.RedisError, ConnectionError) as e:
             logger.error(f"Redis delete error for key '{key}': {str(e)}")
             return False
     
-    def exists(self, key: str) -> bool:
+    async def exists(self, key: str) -> bool:
         """
         Check if a key exists in Redis.
         
@@ -160,12 +220,12 @@ class RedisManager:
             bool: True if the key exists, False otherwise.
         """
         try:
-            return bool(self.client.exists(key))
+            return bool(await self.client.exists(key))
         except (redis.RedisError, ConnectionError) as e:
             logger.error(f"Redis exists error for key '{key}': {str(e)}")
             return False
     
-    def flush_all(self) -> bool:
+    async def flush_all(self) -> bool:
         """
         Flush all keys in the current Redis database.
         WARNING: This will delete all data in the Redis database.
@@ -173,14 +233,15 @@ class RedisManager:
         Returns:
             bool: True if the database was flushed, False otherwise.
         """
+        self._l1.clear()
         try:
-            self.client.flushdb()
+            await self.client.flushdb()
             return True
         except (redis.RedisError, ConnectionError) as e:
             logger.error(f"Redis flushdb error: {str(e)}")
             return False
     
-    def set_many(self, mapping: dict, expiration: int = None) -> bool:
+    async def set_many(self, mapping: dict, expiration: int = None) -> bool:
         """
         Set multiple key-value pairs in Redis with the same expiration.
         
@@ -192,59 +253,74 @@ class RedisManager:
             bool: True if all keys were set, False otherwise.
         """
         try:
-            # Serialize non-string values to JSON
-            serialized_mapping = {}
-            for k, v in mapping.items():
-                if not isinstance(v, (str, bytes)):
-                    serialized_mapping[k] = json.dumps(v)
-                else:
-                    serialized_mapping[k] = v
+            serialized_mapping = {k: self._serialize(v) for k, v in mapping.items()}
                     
-            # Set all keys
-            pipeline = self.client.pipeline()
-            for k, v in serialized_mapping.items():
-                if expiration is None:
-                    pipeline.set(k, v, ex=settings.REDIS_CACHE_EXPIRATION)
-                else:
-                    pipeline.set(k, v, ex=expiration)
-            pipeline.execute()
+            for k in serialized_mapping:
+                self._l1.pop(k, None)
+                
+            if not serialized_mapping:
+                return True
+                
+            # Use default expiration from settings if not specified
+            if expiration is None:
+                expiration = settings.REDIS_CACHE_EXPIRATION
+            ttl_ms = int(expiration * 1000)
+                
+            # Set all keys in a single script call
+            client = self.client
+            try:
+                await self._set_many_script(
+                    keys=list(serialized_mapping),
+                    args=list(serialized_mapping.values()) + [ttl_ms],
+                    client=client,
+                )
+            except redis.ResponseError as e:
+                # Scripting is disabled or denied on this server, fall back to MSET + PEXPIRE
+                logger.warning(f"Redis set_many script failed, falling back to MSET: {str(e)}")
+                pipeline = client.pipeline(transaction=False)
+                pipeline.mset(serialized_mapping)
+                for k in serialized_mapping:
+                    pipeline.pexpire(k, ttl_ms)
+                await pipeline.execute()
             return True
         except (redis.RedisError, ConnectionError) as e:
             logger.error(f"Redis set_many error: {str(e)}")
             return False
     
-    def get_many(self, keys: list) -> dict:
+    async def get_many(self, keys: list, cacheable: bool = False) -> dict:
         """
         Get multiple values from Redis by keys.
         
         Args:
             keys: A list of keys to get.
+            cacheable: Serve keys from the in-process L1 cache and only pipeline the misses to Redis.
             
         Returns:
             dict: A dictionary of key-value pairs for keys that exist.
         """
+        result = {}
+        misses = keys
+        if cacheable:
+            result = {key: self._deserialize(self._l1[key]) for key in keys if key in self._l1}
+            misses = [key for key in keys if key not in result]
+            if not misses:
+                return result
+            
         try:
-            pipeline = self.client.pipeline()
-            for key in keys:
+            pipeline = self.client.pipeline(transaction=False)
+            for key in misses:
                 pipeline.get(key)
-            values = pipeline.execute()
+            values = await pipeline.execute()
             
-            result = {}
-            for i, key in enumerate(keys):
+            for i, key in enumerate(misses):
                 if values[i] is not None:
-                    value = values[i]
-                    # Try to deserialize from JSON if it looks like JSON
-                    if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
-                        try:
-                            result[key] = json.loads(value)
-                            continue
-                        except json.JSONDecodeError:
-                            pass
-                    result[key] = value
+                    result[key] = self._deserialize(values[i])
+                    if cacheable:
+                        self._l1[key] = values[i]
             return result
         except (redis.RedisError, ConnectionError) as e:
             logger.error(f"Redis get_many error: {str(e)}")
-            return {}
+            return result
     
     def build_key(self, *parts) -> str:
         """
@@ -1,16 +1,22 @@
 import typing
 import asyncio
 
+import anyio.to_thread
 from fastapi import FastAPI
 import loguru
 
+from src.config.manager import settings
+from src.external.gov.client import DataGovClient
 from src.repository.events import dispose_db_connection, initialize_db_connection
 from src.utilities.tasks.token_cleanup import start_token_cleanup_task
 
 
 def execute_backend_server_event_handler(backend_app: FastAPI) -> typing.Any:
     async def launch_backend_server_events() -> None:
+        # Threadpool that runs sync endpoints and dependencies (anyio defaults to 40)
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.SERVER_THREAD_POOL_SIZE
         await initialize_db_connection(backend_app=backend_app)
+        await DataGovClient.startup()
         
         # Start background tasks
         # backend_app.state.token_cleanup_task = asyncio.create_task(start_token_cleanup_task())
@@ -29,6 +35,7 @@ def terminate_backend_server_event_handler(backend_app: FastAPI) -> typing.Any:
             except asyncio.CancelledError:
                 pass
         
+        await DataGovClient.shutdown()
         await dispose_db_connection(backend_app=backend_app)
 
     return stop_backend_server_events
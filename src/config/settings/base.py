@@ -1,6 +1,8 @@
 import logging
+import logging.handlers
 import pathlib
 import os
+import sys
 
 import decouple
 
@@ -14,15 +16,28 @@ except ImportError:
 
 ROOT_DIR: pathlib.Path = pathlib.Path(__file__).parent.parent.parent.parent.resolve()
 
+# Settings load before the application logger is configured, so buffer these few lines and write them once
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_config_log_handler = logging.handlers.MemoryHandler(capacity=1024, target=logging.StreamHandler(sys.stdout))
+logger.addHandler(_config_log_handler)
+
 # Load environment files at module level
 def get_config():
+    try:
+        return _load_config()
+    finally:
+        _config_log_handler.flush()
+
+def _load_config():
     main_env_file = f"{str(ROOT_DIR)}/.env"
-    print(f"Loading environment configuration from: {main_env_file}")
+    logger.info("Loading environment configuration from: %s", main_env_file)
     
     # First load main .env to get ENVIRONMENT
     config = decouple.Config(decouple.RepositoryEnv(main_env_file))
     environment = config("ENVIRONMENT", default="LOCAL")
-    print(f"Environment set to: {environment}")
+    logger.info("Environment set to: %s", environment)
     
     # Based on ENVIRONMENT, load the specific env file
     env_file_mapping = {
@@ -35,7 +50,7 @@ def get_config():
     if specific_env_file:
         env_file_path = f"{str(ROOT_DIR)}/{specific_env_file}"
         if os.path.exists(env_file_path):
-            print(f"Loading environment file: {specific_env_file}")
+            logger.info("Loading environment file: %s", specific_env_file)
             # Create a new config that searches both files
             return decouple.Config(decouple.RepositoryEnv(env_file_path))
     
@@ -54,6 +69,7 @@ class BackendBaseSettings(BaseSettings):
     SERVER_HOST: str = config("BACKEND_SERVER_HOST", cast=str)
     SERVER_PORT: int = config("BACKEND_SERVER_PORT", cast=int)
     SERVER_WORKERS: int = config("BACKEND_SERVER_WORKERS", cast=int)
+    SERVER_THREAD_POOL_SIZE: int = config("BACKEND_SERVER_THREAD_POOL_SIZE", cast=int, default=200)
     API_PREFIX: str = "/api"
     DOCS_URL: str = "/docs"
     OPENAPI_URL: str = "/openapi.json"
@@ -107,6 +123,7 @@ class BackendBaseSettings(BaseSettings):
     # Data Gov
     DATA_GOV_API_KEY: str = config("DATA_GOV_API_KEY", cast=str)
     DATA_GOV_URL: str = config("DATA_GOV_URL", cast=str)
+    DATA_GOV_MAX_CONCURRENCY: int = config("DATA_GOV_MAX_CONCURRENCY", cast=int, default=20)
 
     IS_ALLOWED_CREDENTIALS: bool = config("IS_ALLOWED_CREDENTIALS", cast=bool)
     ALLOWED_ORIGINS: list[str] = [
@@ -134,6 +151,10 @@ class BackendBaseSettings(BaseSettings):
     REDIS_HOST: str = config("REDIS_HOST", cast=str, default="localhost")
     REDIS_PORT: int = config("REDIS_PORT", cast=int, default=6379)
     REDIS_DB: int = config("REDIS_DB", cast=int, default=0)
+    REDIS_USERNAME: str = config("REDIS_USERNAME", cast=str, default="")
+    REDIS_PASSWORD: str = config("REDIS_PASSWORD", cast=str, default="")
+    REDIS_DECODE_RESPONSES: bool = config("REDIS_DECODE_RESPONSES", cast=bool, default=False)
+    REDIS_CACHE_EXPIRATION: int = config("REDIS_CACHE_EXPIRATION", cast=int, default=3600)
 
     # Email settings
     EMAIL_SENDER: str = config("EMAIL_SENDER", cast=str, default="noreply@yourdomain.com")
@@ -4,83 +4,174 @@ This client provides a simple interface for making API calls to Data.gov endpoin
 """
 
 import httpx
-import json
+import orjson
 import typing
+import random
 import asyncio
-from urllib.parse import urljoin
+import datetime
+import functools
+import itertools
+import email.utils
+from cachetools import TLRUCache
 from src.config.manager import settings
 from src.utilities.logging.logger import logger
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+# Request bodies are encoded with orjson, so the content type has to be set by hand
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Statuses worth retrying: request timeout, rate limiting and transient server errors
+_RETRY_STATUSES: typing.Final[frozenset[int]] = frozenset({408, 429, 500, 502, 503, 504})
+
+def _response_cache_expiry(_key: tuple, value: tuple, now: float) -> float:
+    """Cached entries are stored as (ttl, body) so every GET can choose its own TTL."""
+    return now + value[0]
+
+def _parse_retry_after(value: typing.Optional[str]) -> typing.Optional[float]:
+    """Read a Retry-After header given either as delay-seconds or as an HTTP-date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
 class DataGovClient:
     """
     Asynchronous client for interacting with Data.gov APIs.
     
     This client handles authentication, request formatting, and response parsing
     for Data.gov API endpoints. It supports various endpoints and data formats.
+    
+    Every instance sends requests through one pooled httpx client that is created on
+    first use (or by startup()) and closed by shutdown() from the app lifecycle.
+    Routes use instance() rather than constructing their own client.
     """
     
-    def __init__(self, max_retries=3, retry_delay=1):
+    _shared_client: typing.Optional[httpx.AsyncClient] = None
+    _instance: typing.Optional["DataGovClient"] = None
+    # Created on first use so it binds to the running event loop, not the one at import time
+    _global_sem: typing.ClassVar[typing.Optional[asyncio.Semaphore]] = None
+    
+    # Raw GET response bodies shared by all instances, keyed on (endpoint, sorted query params)
+    RESPONSE_CACHE_MAXSIZE = 1024
+    MANDI_PRICES_CACHE_TTL = 900
+    _response_cache: TLRUCache = TLRUCache(maxsize=RESPONSE_CACHE_MAXSIZE, ttu=_response_cache_expiry)
+    
+    # Endpoint paths, relative to the shared client's base_url
+    MANDI_PRICES_ENDPOINT = "/resource/9ef84268-d588-465a-a308-a864a43d0070"
+    # Query parameter names for get_mandi_prices' filters, in argument order
+    MANDI_FILTER_PARAMS = (
+        "filters[state.keyword]",
+        "filters[district]",
+        "filters[market]",
+        "filters[commodity]",
+        "filters[variety]",
+        "filters[grade]",
+    )
+    
+    # Upper bound on a server-requested Retry-After wait, since the upstream budget is held while sleeping
+    MAX_RETRY_AFTER = 60
+    
+    def __init__(self, max_retries=3, retry_delay=1, cache_ttl: int = 900, max_rate_limit_retries: int = 3):
         """
         Initialize the Data.gov API client.
         
         Args:
-            max_retries: Maximum number of retry attempts for failed requests.
-            retry_delay: Base delay between retries in seconds (will be exponentially increased).
+            max_retries: Maximum number of retry attempts for transient failures (timeouts, network errors, 5xx).
+            retry_delay: Base delay between retries in seconds (will be exponentially increased, with jitter).
+            cache_ttl: Default number of seconds to serve a GET response from memory. 0 disables caching.
+            max_rate_limit_retries: Maximum number of retries after a 429, counted separately from max_retries.
         """
-        self.base_url = settings.DATA_GOV_URL
-        self.api_key = settings.DATA_GOV_API_KEY
-        self.client = None
         self.max_retries = max_retries
+        self.max_rate_limit_retries = max_rate_limit_retries
         self.retry_delay = retry_delay
-        
-    async def __aenter__(self):
-        """Set up the httpx client when entering a context manager."""
-        if self.client is None:
-            self.client = httpx.AsyncClient()
-        return self
-        
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close the httpx client when exiting a context manager."""
-        if self.client is not None:
-            await self.client.aclose()
-            self.client = None
+        self.cache_ttl = cache_ttl
+    
+    @classmethod
+    def _get_shared_client(cls) -> httpx.AsyncClient:
+        """Get the shared httpx client, creating it on first use."""
+        if cls._shared_client is None:
+            cls._shared_client = httpx.AsyncClient(
+                base_url=settings.DATA_GOV_URL,
+                params={"api-key": settings.DATA_GOV_API_KEY},
+                http2=HTTP2_ENABLED,
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+                timeout=httpx.Timeout(10.0, connect=5.0),
+            )
+        return cls._shared_client
     
-    async def _ensure_client(self):
-        """Ensure a httpx client exists."""
-        if self.client is None:
-            self.client = httpx.AsyncClient()
+    @classmethod
+    def _get_global_semaphore(cls) -> asyncio.Semaphore:
+        """Get the semaphore that caps concurrent requests to Data.gov across all instances."""
+        if cls._global_sem is None:
+            cls._global_sem = asyncio.Semaphore(settings.DATA_GOV_MAX_CONCURRENCY)
+        return cls._global_sem
     
-    async def close(self):
-        """Close the client session."""
-        if self.client is not None:
-            await self.client.aclose()
-            self.client = None
+    @classmethod
+    async def startup(cls) -> None:
+        """Create the shared httpx client used by every DataGovClient."""
+        cls._get_shared_client()
     
-    def _build_url(self, endpoint: str) -> str:
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared httpx client and drop the shared instance."""
+        cls._instance = None
+        cls._global_sem = None
+        if cls._shared_client is not None:
+            await cls._shared_client.aclose()
+            cls._shared_client = None
+    
+    @classmethod
+    def instance(cls) -> "DataGovClient":
         """
-        Build a complete URL for a given endpoint.
+        Get the shared DataGovClient instance.
         
-        Args:
-            endpoint: The API endpoint path.
-            
         Returns:
-            The complete URL with the base URL and endpoint.
+            A DataGovClient that sends requests through the shared httpx client.
         """
-        return urljoin(self.base_url, endpoint)
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
     
-    def _add_api_key(self, params: dict = None) -> dict:
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared httpx client; its connection pool outlives any single DataGovClient."""
+        return self._get_shared_client()
+        
+    async def __aenter__(self):
+        """Kept for compatibility; the shared client needs no per-use setup."""
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Kept for compatibility; the shared client is closed by shutdown()."""
+        pass
+    
+    def _invalidate_cached_responses(self, endpoint: str) -> None:
         """
-        Add the API key to request parameters.
+        Drop cached GET responses for an endpoint and everything below it.
         
         Args:
-            params: Existing query parameters.
-            
-        Returns:
-            Updated parameters with the API key added.
+            endpoint: The API endpoint path that was written to.
         """
-        params = params or {}
-        params['api-key'] = self.api_key
-        return params
+        # Match whole path segments so /resource/abc does not also evict /resource/abcdef
+        endpoint = endpoint.rstrip("/")
+        prefix = endpoint + "/"
+        stale = [key for key in self._response_cache if key[0].rstrip("/") == endpoint or key[0].startswith(prefix)]
+        for key in stale:
+            self._response_cache.pop(key, None)
     
     async def _make_request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
@@ -97,68 +188,95 @@ class DataGovClient:
         Raises:
             httpx.HTTPError: If the request fails after all retries
         """
-        await self._ensure_client()
-        
         request_method = getattr(self.client, method.lower())
         retries = 0
-        last_exception = None
+        rate_limit_retries = 0
         
-        while retries <= self.max_retries:
-            try:
-                if retries > 0:
-                    # Only log retries, not the initial attempt
-                    logger.info(f"Retry attempt {retries} for {method} request to {url}")
-                
-                response = await request_method(url, **kwargs)
-                response.raise_for_status()
-                return response
+        # Every request shares one upstream budget, retries and backoff included
+        async with self._get_global_semaphore():
+            while True:
+                try:
+                    response = await request_method(url, **kwargs)
+                    response.raise_for_status()
+                    return response
                 
-            except (httpx.HTTPError, httpx.NetworkError, httpx.TimeoutException) as e:
-                last_exception = e
-                # Only retry on certain status codes that indicate temporary issues
-                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in (408, 429, 500, 502, 503, 504):
-                    # Don't retry on client errors except timeout (408) and rate limit (429)
-                    raise
+                except httpx.HTTPStatusError as e:
+                    error = e
+                    status_code = e.response.status_code
+                    if status_code not in _RETRY_STATUSES:
+                        # Don't retry on client errors except timeout (408) and rate limit (429)
+                        raise
+                    
+                    if status_code == 429:
+                        # Rate limiting has its own budget so it does not use up retries meant for transient errors
+                        rate_limit_retries += 1
+                        if rate_limit_retries > self.max_rate_limit_retries:
+                            logger.error(f"Maximum rate limit retries ({self.max_rate_limit_retries}) reached for {url}")
+                            raise
+                        
+                        # Honor the server's Retry-After, and only fall back to backoff without one
+                        delay = _parse_retry_after(e.response.headers.get("Retry-After"))
+                        if delay is None:
+                            delay = self._backoff_delay(rate_limit_retries)
+                        delay = min(delay, self.MAX_RETRY_AFTER)
+                    else:
+                        retries += 1
+                        if retries > self.max_retries:
+                            logger.error(f"Maximum retry attempts ({self.max_retries}) reached for {url}")
+                            raise
+                        delay = self._backoff_delay(retries)
                 
-                retries += 1
-                if retries > self.max_retries:
-                    logger.error(f"Maximum retry attempts ({self.max_retries}) reached for {url}")
-                    raise
+                except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                    error = e
+                    retries += 1
+                    if retries > self.max_retries:
+                        logger.error(f"Maximum retry attempts ({self.max_retries}) reached for {url}")
+                        raise
+                    delay = self._backoff_delay(retries)
                 
-                # Exponential backoff
-                delay = self.retry_delay * (2 ** (retries - 1))
-                logger.warning(f"Request failed: {str(e)}. Retrying in {delay} seconds...")
+                logger.warning(f"Request failed: {str(error)}. Retrying {method} request to {url} in {delay:.2f} seconds...")
                 await asyncio.sleep(delay)
-        
-        # This should not be reached, but just in case
-        if last_exception:
-            raise last_exception
-        raise httpx.RequestError(f"Failed to make request to {url} after {self.max_retries} retries")
     
-    async def get(self, endpoint: str, params: dict = None) -> typing.Dict:
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff for the given retry attempt, jittered to 50-150% so workers don't retry in lockstep.
+        """
+        return self.retry_delay * (2 ** (attempt - 1)) * (0.5 + random.random())
+    
+    async def get(self, endpoint: str, params: dict = None, cache_ttl: int = None) -> typing.Dict:
         """
         Make a GET request to a Data.gov API endpoint.
         
         Args:
             endpoint: The API endpoint path.
             params: Query parameters to include in the request.
+            cache_ttl: Seconds to serve this response from memory. Defaults to the client's cache_ttl.
             
         Returns:
-            The JSON response data as a dictionary.
+            The JSON response data as a dictionary. Cached responses are decoded again for every
+            call, so callers get their own copy and may mutate it.
             
         Raises:
             httpx.HTTPError: If the request fails after all retries.
-            json.JSONDecodeError: If the response is not valid JSON.
+            orjson.JSONDecodeError: If the response is not valid JSON.
         """
-        params = self._add_api_key(params)
-        url = self._build_url(endpoint)
+        cache_ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+        if cache_ttl > 0:
+            # Key on the encoded query string so list values and other unhashable params still work
+            cache_key = (endpoint, tuple(sorted(httpx.QueryParams(params or {}).multi_items())))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached[1])
         
         try:
-            logger.info(f"Making GET request to {url}")
-            response = await self._make_request_with_retry('get', url, params=params)
-            return response.json()
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON response from {url}: {str(e)}")
+            logger.info(f"Making GET request to {endpoint}")
+            response = await self._make_request_with_retry('get', endpoint, params=params or None)
+            data = orjson.loads(response.content)
+            if cache_ttl > 0:
+                self._response_cache[cache_key] = (cache_ttl, response.content)
+            return data
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON response from {endpoint}: {str(e)}")
             raise
     
     async def post(self, endpoint: str, data: dict = None, params: dict = None) -> typing.Dict:
@@ -175,17 +293,21 @@ class DataGovClient:
             
         Raises:
             httpx.HTTPError: If the request fails after all retries.
-            json.JSONDecodeError: If the response is not valid JSON.
+            orjson.JSONDecodeError: If the response is not valid JSON.
         """
-        params = self._add_api_key(params)
-        url = self._build_url(endpoint)
-        
         try:
-            logger.info(f"Making POST request to {url}")
-            response = await self._make_request_with_retry('post', url, json=data, params=params)
-            return response.json()
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON response from {url}: {str(e)}")
+            logger.info(f"Making POST request to {endpoint}")
+            response = await self._make_request_with_retry(
+                'post',
+                endpoint,
+                content=orjson.dumps(data) if data is not None else None,
+                headers=JSON_HEADERS if data is not None else None,
+                params=params or None,
+            )
+            self._invalidate_cached_responses(endpoint)
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON response from {endpoint}: {str(e)}")
             raise
     
     async def put(self, endpoint: str, data: dict = None, params: dict = None) -> typing.Dict:
@@ -200,15 +322,19 @@ class DataGovClient:
         Returns:
             The JSON response data as a dictionary.
         """
-        params = self._add_api_key(params)
-        url = self._build_url(endpoint)
-        
         try:
-            logger.info(f"Making PUT request to {url}")
-            response = await self._make_request_with_retry('put', url, json=data, params=params)
-            return response.json()
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON response from {url}: {str(e)}")
+            logger.info(f"Making PUT request to {endpoint}")
+            response = await self._make_request_with_retry(
+                'put',
+                endpoint,
+                content=orjson.dumps(data) if data is not None else None,
+                headers=JSON_HEADERS if data is not None else None,
+                params=params or None,
+            )
+            self._invalidate_cached_responses(endpoint)
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON response from {endpoint}: {str(e)}")
             raise
     
     async def delete(self, endpoint: str, params: dict = None) -> typing.Dict:
@@ -222,15 +348,13 @@ class DataGovClient:
         Returns:
             The JSON response data as a dictionary.
         """
-        params = self._add_api_key(params)
-        url = self._build_url(endpoint)
-        
         try:
-            logger.info(f"Making DELETE request to {url}")
-            response = await self._make_request_with_retry('delete', url, params=params)
-            return response.json()
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON response from {url}: {str(e)}")
+            logger.info(f"Making DELETE request to {endpoint}")
+            response = await self._make_request_with_retry('delete', endpoint, params=params or None)
+            self._invalidate_cached_responses(endpoint)
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Error decoding JSON response from {endpoint}: {str(e)}")
             raise
 
     # Example of a specific API method for a Data.gov dataset
@@ -245,9 +369,14 @@ class DataGovClient:
         Returns:
             The agricultural data as a dictionary.
         """
-        endpoint = f"/api/datasets/{dataset_id}/data"
         params = query_params or {}
-        return await self.get(endpoint, params)
+        return await self.get(self._agricultural_data_endpoint(dataset_id), params)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _agricultural_data_endpoint(dataset_id: str) -> str:
+        """Build the data endpoint path for a dataset, once per dataset id."""
+        return f"/api/datasets/{dataset_id}/data"
     
     async def get_mandi_prices(self, 
                                format: str = "json", 
@@ -258,7 +387,8 @@ class DataGovClient:
                                market: str = None, 
                                commodity: str = None, 
                                variety: str = None, 
-                               grade: str = None) -> typing.Dict:
+                               grade: str = None,
+                               cache_ttl: int = None) -> typing.Dict:
         """
         Get current daily price of various commodities from various markets (Mandi).
         
@@ -272,12 +402,12 @@ class DataGovClient:
             commodity: Filter by commodity.
             variety: Filter by variety.
             grade: Filter by grade.
+            cache_ttl: Seconds to serve this response from memory. Defaults to MANDI_PRICES_CACHE_TTL,
+                pass 0 when the caller caches the result itself.
             
         Returns:
             The commodity price data as a dictionary.
         """
-        endpoint = "/resource/9ef84268-d588-465a-a308-a864a43d0070"
-        
         # Build query parameters
         params = {
             'format': format,
@@ -286,19 +416,37 @@ class DataGovClient:
         }
         
         # Add optional filters if provided
-        if state:
-            params['filters[state.keyword]'] = state
-        if district:
-            params['filters[district]'] = district
-        if market:
-            params['filters[market]'] = market
-        if commodity:
-            params['filters[commodity]'] = commodity
-        if variety:
-            params['filters[variety]'] = variety
-        if grade:
-            params['filters[grade]'] = grade
+        filters = (state, district, market, commodity, variety, grade)
+        params.update({key: value for key, value in zip(self.MANDI_FILTER_PARAMS, filters) if value})
+        
+        if cache_ttl is None:
+            cache_ttl = self.MANDI_PRICES_CACHE_TTL
+        return await self.get(self.MANDI_PRICES_ENDPOINT, params, cache_ttl=cache_ttl)
+    
+    async def get_mandi_prices_bulk(self,
+                                    total: int,
+                                    page_size: int = 1000,
+                                    concurrency: int = None,
+                                    **filters) -> typing.List[typing.Dict]:
+        """
+        Fetch up to `total` mandi price records by requesting all pages concurrently.
+        
+        Args:
+            total: Number of records to fetch.
+            page_size: Number of records requested per page.
+            concurrency: Maximum number of pages in flight. Defaults to DATA_GOV_MAX_CONCURRENCY.
+            **filters: Filters accepted by get_mandi_prices (state, district, market, ...).
+            
+        Returns:
+            The records of all pages, in offset order.
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.DATA_GOV_MAX_CONCURRENCY)
+        
+        async def fetch_page(offset: int) -> typing.Dict:
+            async with semaphore:
+                return await self.get_mandi_prices(offset=offset, limit=min(page_size, total - offset), **filters)
         
-        return await self.get(endpoint, params)
+        pages = await asyncio.gather(*(fetch_page(offset) for offset in range(0, total, page_size)))
+        return list(itertools.chain.from_iterable(page.get("records", []) for page in pages))
     
     # Add more specific methods for other Data.gov APIs as needed
\ No newline at end of file
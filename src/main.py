@@ -1,16 +1,18 @@
 from fastapi import FastAPI
 import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.api.endpoints import router as api_endpoint_router
+from src.api.routes import api_router
 from src.config.events import execute_backend_server_event_handler, terminate_backend_server_event_handler
 from src.config.manager import settings
-from src.utilities.exceptions.database import EntityDoesNotExist
-from src.utilities.exceptions.exceptions import *
+from src.utilities.exceptions.exceptions import EXCEPTION_HANDLERS
+from src.utilities.server import select_event_loop, select_http_protocol
 
 
 def initialize_backend_application() -> FastAPI:
-    app = FastAPI(**settings.set_backend_app_attributes)  # type: ignore
+    app = FastAPI(default_response_class=ORJSONResponse, **settings.set_backend_app_attributes)  # type: ignore
 
     app.add_middleware(
         CORSMiddleware,
@@ -19,16 +21,10 @@ def initialize_backend_application() -> FastAPI:
         allow_methods=settings.ALLOWED_METHODS,
         allow_headers=settings.ALLOWED_HEADERS,
     )
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-    app.add_exception_handler(UserNotFoundException, user_not_found_exception_handler)
-    app.add_exception_handler(UserAlreadyExistsException, user_already_exists_exception_handler)
-    app.add_exception_handler(InvalidCredentialsException, invalid_credentials_exception_handler)
-    app.add_exception_handler(AuthorizationHeaderException, authorization_header_exception_handler)
-    app.add_exception_handler(SecurityException, security_exception_handler)
-    app.add_exception_handler(EntityDoesNotExist, entity_does_not_exist_exception_handler)
-    app.add_exception_handler(EntityAlreadyExists, entity_already_exists_exception_handler)
-    app.add_exception_handler(InternalServerErrorException, internal_server_error_exception_handler)
-    app.add_exception_handler(Exception, general_exception_handler)
+    for exception_class, handler in EXCEPTION_HANDLERS:
+        app.add_exception_handler(exception_class, handler)
 
     app.add_event_handler(
         "startup",
@@ -39,7 +35,7 @@ def initialize_backend_application() -> FastAPI:
         terminate_backend_server_event_handler(backend_app=app),
     )
 
-    app.include_router(router=api_endpoint_router, prefix=settings.API_PREFIX)
+    app.include_router(router=api_router, prefix=settings.API_PREFIX)
 
     return app
 
@@ -54,4 +50,6 @@ if __name__ == "__main__":
         reload=settings.DEBUG,
         workers=settings.SERVER_WORKERS,
         log_level=settings.LOGGING_LEVEL,
+        loop=select_event_loop(),
+        http=select_http_protocol(),
     )
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import uuid
 import sqlalchemy
 from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column, relationship
@@ -8,13 +9,29 @@ from sqlalchemy import ForeignKey
 
 from src.repository.table import Base, generate_uuid
 
+
+def compute_jwt_hash(jwt: str) -> int:
+    """
+    Signed 64-bit lookup key for a token: the first 8 bytes of its MD5 digest.
+
+    Matches `('x' || substr(md5(jwt), 1, 16))::bit(64)::bigint` in Postgres, which the migration uses to backfill.
+    Only used to narrow the index lookup, the raw token is always compared as well.
+    """
+    digest = hashlib.md5(jwt.encode("utf-8"), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
 class JwtRecord(Base):
     __tablename__ = "jwt_record"
+    __table_args__ = (
+        sqlalchemy.Index("ix_jwt_expires_brin", "expires_at", postgresql_using="brin"),
+    )
 
     id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid4
     )
-    jwt: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=1024), nullable=False, unique=True, index=True)
+    jwt: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=1024), nullable=False)
+    jwt_hash: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.BigInteger, nullable=False, index=True)
     user_id: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
         UUID(as_uuid=True), ForeignKey("user.id"), nullable=False, index=True
     )
@@ -44,7 +61,7 @@ class JwtRecord(Base):
     )
     
     # Relationship with Device model
-    device = relationship("Device", back_populates="jwt_records")
+    device = relationship("Device", back_populates="jwt_records", lazy="raise")
     # Add relationship with User model
     user = relationship("User", backref="jwt_records")
 
@@ -1,7 +1,7 @@
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import EmailStr
+from pydantic import EmailStr, Field
 from src.models.schemas.base import BaseSchemaModel
 
 class LoginRequest(BaseSchemaModel):
@@ -41,7 +41,7 @@ class DeviceDetailResponse(BaseSchemaModel):
     hardware_info: Optional[Dict[str, Any]] = None
     location_info: Optional[Dict[str, Any]] = None
     android_info: Optional[Dict[str, Any]] = None
-    client_data: Dict[str, Any] = {}
+    client_data: Dict[str, Any] = Field(default_factory=dict)
 
 
 class UpdateDeviceInfoRequest(BaseSchemaModel):
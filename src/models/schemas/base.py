@@ -6,16 +6,16 @@ import pydantic
 from src.utilities.formatters.datetime_formatter import format_datetime_into_isoformat
 from src.utilities.formatters.field_formatter import format_dict_key_to_camel_case
 
+# Datetime that serializes to an ISO-8601 "Z" string in JSON output; use it for datetime fields on schemas
+IsoDateTime = typing.Annotated[
+    datetime.datetime, pydantic.PlainSerializer(format_datetime_into_isoformat, when_used="json")
+]
+
 
 class BaseSchemaModel(pydantic.BaseModel):
-    class Config(pydantic.BaseConfig):
-        orm_mode: bool = True
-        validate_assignment: bool = True
-        allow_population_by_field_name: bool = True
-        json_encoders: dict = {datetime.datetime: format_datetime_into_isoformat}
-        alias_generator: typing.Any = format_dict_key_to_camel_case
-        populate_by_name = True
-        aliases = {
-            "client_data": "clientData"
-        }
-        
\ No newline at end of file
+    model_config = pydantic.ConfigDict(
+        from_attributes=True,
+        validate_assignment=True,
+        populate_by_name=True,
+        alias_generator=format_dict_key_to_camel_case,
+    )
@@ -1,17 +1,21 @@
 import datetime
-from typing import Optional, Dict, Any, List
+from typing import Dict, Any, List
 import uuid
 
 import pydantic
 
 
 class JWToken(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, extra="forbid")
+
     exp: datetime.datetime
     sub: str
     jti: str  # JWT ID for token identification
 
 
 class JWTUser(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, extra="forbid")
+
     username: str
     email: pydantic.EmailStr
     user_type: str = "CONSUMER"  # Default to CONSUMER
@@ -19,90 +23,94 @@ class JWTUser(pydantic.BaseModel):
 
 
 class DeviceInfo(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="ignore")
+
     android_id: str  # Now required for device identification
-    device_id: Optional[str] = None  # Legacy identifier, no longer required
-    device_name: Optional[str] = None
-    device_type: Optional[str] = None
-    ip_address: Optional[str] = None
-    user_agent: Optional[str] = None
+    device_id: str | None = None  # Legacy identifier, no longer required
+    device_name: str | None = None
+    device_type: str | None = None
+    ip_address: str | None = None
+    user_agent: str | None = None
     
     # Android specific fields
-    manufacturer: Optional[str] = None
-    model: Optional[str] = None
-    os_version: Optional[str] = None
-    app_version: Optional[str] = None
-    screen_resolution: Optional[str] = None
-    network_type: Optional[str] = None
-    device_language: Optional[str] = None
-    battery_level: Optional[float] = None
-    is_rooted: Optional[bool] = None
+    manufacturer: str | None = None
+    model: str | None = None
+    os_version: str | None = None
+    app_version: str | None = None
+    screen_resolution: str | None = None
+    network_type: str | None = None
+    device_language: str | None = None
+    battery_level: float | None = None
+    is_rooted: bool | None = None
     
     # iOS specific fields
-    device_model: Optional[str] = None  # Specific iOS model identifier (e.g., iPhone12,1)
-    ios_version: Optional[str] = None   # iOS-specific version field
-    is_jailbroken: Optional[bool] = None # Whether the iOS device is jailbroken
+    device_model: str | None = None  # Specific iOS model identifier (e.g., iPhone12,1)
+    ios_version: str | None = None   # iOS-specific version field
+    is_jailbroken: bool | None = None # Whether the iOS device is jailbroken
     
     # Hardware information
-    cpu_info: Optional[str] = None
-    total_memory: Optional[str] = None
-    available_memory: Optional[str] = None
-    total_storage: Optional[str] = None
-    available_storage: Optional[str] = None
+    cpu_info: str | None = None
+    total_memory: str | None = None
+    available_memory: str | None = None
+    total_storage: str | None = None
+    available_storage: str | None = None
     
     # Browser specific fields (for web clients)
-    browser_name: Optional[str] = None
-    browser_version: Optional[str] = None
+    browser_name: str | None = None
+    browser_version: str | None = None
     
     # Geolocation data (if available and permitted)
-    country_code: Optional[str] = None
-    region: Optional[str] = None
-    city: Optional[str] = None
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
+    country_code: str | None = None
+    region: str | None = None
+    city: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
     
     # Extended device security info
-    device_hash: Optional[str] = None  # Unique device identifier hash
-    last_security_patch: Optional[str] = None
+    device_hash: str | None = None  # Unique device identifier hash
+    last_security_patch: str | None = None
     
     # Device status
-    is_blacklisted: Optional[bool] = None
-    blacklist_reason: Optional[str] = None
+    is_blacklisted: bool | None = None
+    blacklist_reason: str | None = None
     
     # Custom client data that can be sent from the device
-    client_data: Dict[str, Any] = {}
+    client_data: Dict[str, Any] = pydantic.Field(default_factory=dict)
 
 
 class DeviceBlacklistRequest(pydantic.BaseModel):
     android_id: str  # Changed from device_id to android_id 
-    reason: Optional[str] = None
+    reason: str | None = None
 
 
 class DeviceResponse(pydantic.BaseModel):
     id: uuid.UUID
     device_id: uuid.UUID
-    device_name: Optional[str] = None
-    device_type: Optional[str] = None
-    manufacturer: Optional[str] = None
-    model: Optional[str] = None
-    os_version: Optional[str] = None
-    ip_address: Optional[str] = None
+    device_name: str | None = None
+    device_type: str | None = None
+    manufacturer: str | None = None
+    model: str | None = None
+    os_version: str | None = None
+    ip_address: str | None = None
     is_blacklisted: bool = False
-    last_used_at: Optional[int] = None
-    created_at: Optional[int] = None
+    last_used_at: int | None = None
+    created_at: int | None = None
     
     # iOS specific fields
-    device_model: Optional[str] = None
-    ios_version: Optional[str] = None
-    is_jailbroken: Optional[bool] = None
+    device_model: str | None = None
+    ios_version: str | None = None
+    is_jailbroken: bool | None = None
     
     # Web specific fields
-    browser_name: Optional[str] = None
-    browser_version: Optional[str] = None
+    browser_name: str | None = None
+    browser_version: str | None = None
 
 
 class JWTResponse(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True, extra="forbid")
+
     access_token: str
     token_type: str = "bearer"
     expires_in: int
     device_id: str  # This will contain the android_id in responses
-    refresh_token: Optional[str] = None
+    refresh_token: str | None = None
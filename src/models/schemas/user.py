@@ -1,4 +1,3 @@
-import datetime
 import enum
 import uuid
 from typing import Optional
@@ -6,7 +5,7 @@ from typing import Optional
 import pydantic
 
 from src.models.db.user import UserTypeEnum
-from src.models.schemas.base import BaseSchemaModel
+from src.models.schemas.base import BaseSchemaModel, IsoDateTime
 
 
 class UserInCreate(BaseSchemaModel):
@@ -36,8 +35,8 @@ class UserWithToken(BaseSchemaModel):
     is_verified: bool
     is_active: bool
     is_logged_in: bool
-    created_at: datetime.datetime
-    updated_at: datetime.datetime | None
+    created_at: IsoDateTime
+    updated_at: IsoDateTime | None
 
 
 class UserInResponse(BaseSchemaModel):
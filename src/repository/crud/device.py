@@ -203,8 +203,8 @@ class DeviceCRUDRepository(BaseCRUDRepository):
             
         # Update client data by merging
         if device_info.client_data:
-            if not device.client_data:
-                device.client_data = {}
+            # Assign a new dict rather than updating in place so the JSONB change is tracked
+            device.client_data = {**(device.client_data or {}), **device_info.client_data}
                 
         # Update last_used_at timestamp
         stmt = sqlalchemy.text("SELECT EXTRACT(EPOCH FROM NOW())")
@@ -1,10 +1,11 @@
 import sqlalchemy
+from sqlalchemy.orm import selectinload
 import datetime
 import uuid
 from typing import Optional, List, Dict, Any
 
 from src.config.manager import settings
-from src.models.db.jwt import JwtRecord
+from src.models.db.jwt import JwtRecord, compute_jwt_hash
 from src.models.db.device import Device
 from src.repository.crud.base import BaseCRUDRepository
 from src.repository.crud.device import DeviceCRUDRepository
@@ -13,6 +14,13 @@ from src.models.schemas.jwt import DeviceInfo
 from src.utilities.logging.logger import logger
 
 
+def _jwt_matches(jwt: str) -> sqlalchemy.ColumnElement[bool]:
+    """
+    Look a token up through the narrow jwt_hash index, then compare the raw string to rule out collisions.
+    """
+    return sqlalchemy.and_(JwtRecord.jwt_hash == compute_jwt_hash(jwt), JwtRecord.jwt == jwt)
+
+
 class JwtRecordCRUDRepository(BaseCRUDRepository):
     async def create_jwt_record(self, jwt: str, user_id: int, device_info: DeviceInfo, token_type: str = "access", expires_in: int = None) -> JwtRecord:
         """
@@ -44,6 +52,7 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
         # Create JWT record with reference to device
         jwt_record = JwtRecord(
             jwt=jwt,
+            jwt_hash=compute_jwt_hash(jwt),
             user_id=user_id,
             android_id=device.android_id,
             token_type=token_type,
@@ -84,6 +93,7 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
         # Create refresh token
         refresh_record = JwtRecord(
             jwt=refresh_token,
+            jwt_hash=compute_jwt_hash(refresh_token),
             user_id=user_id,
             android_id=device.android_id,
             token_type="refresh",
@@ -95,6 +105,7 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
         # Create access token record
         access_record = JwtRecord(
             jwt=access_token,
+            jwt_hash=compute_jwt_hash(access_token),
             user_id=user_id,
             android_id=device.android_id,
             token_type="access",
@@ -113,7 +124,7 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
         return refresh_record, access_record
 
     async def blacklist_jwt(self, jwt: str) -> JwtRecord:
-        stmt = sqlalchemy.select(JwtRecord).where(JwtRecord.jwt == jwt)
+        stmt = sqlalchemy.select(JwtRecord).where(_jwt_matches(jwt))
         result = await self.async_session.execute(stmt)
         jwt_record = result.scalar_one_or_none()
 
@@ -160,7 +171,7 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
 
     async def is_jwt_blacklisted(self, jwt: str) -> bool:
         # Check if the token itself is blacklisted
-        stmt = sqlalchemy.select(JwtRecord).where(JwtRecord.jwt == jwt)
+        stmt = sqlalchemy.select(JwtRecord).where(_jwt_matches(jwt)).options(selectinload(JwtRecord.device))
         result = await self.async_session.execute(stmt)
         jwt_record = result.scalar_one_or_none()
         
@@ -171,28 +182,21 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
             return True
             
         # Also check if the device is blacklisted
-        device_stmt = (
-            sqlalchemy.select(Device.is_blacklisted)
-            .where(Device.android_id == jwt_record.android_id)
-        )
-        device_result = await self.async_session.execute(device_stmt)
-        device_blacklisted = device_result.scalar_one_or_none()
-        
-        return bool(device_blacklisted)
+        return bool(jwt_record.device and jwt_record.device.is_blacklisted)
     
     async def update_last_used(self, jwt: str) -> None:
         """Update the last_used_at timestamp for a token and its device"""
         current_time = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
         
         # First get the token to find the android id
-        token_stmt = sqlalchemy.select(JwtRecord.android_id).where(JwtRecord.jwt == jwt)
+        token_stmt = sqlalchemy.select(JwtRecord.android_id).where(_jwt_matches(jwt))
         token_result = await self.async_session.execute(token_stmt)
         android_id = token_result.scalar_one_or_none()
         
         # Update token last_used_at
         stmt = (
             sqlalchemy.update(JwtRecord)
-            .where(JwtRecord.jwt == jwt)
+            .where(_jwt_matches(jwt))
             .values(last_used_at=current_time)
         )
         await self.async_session.execute(stmt)
@@ -209,8 +213,8 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
         await self.async_session.commit()
     
     async def get_token_record(self, jwt: str) -> Optional[JwtRecord]:
-        """Get the token record by JWT string"""
-        stmt = sqlalchemy.select(JwtRecord).where(JwtRecord.jwt == jwt)
+        """Get the token record by JWT string, with its device loaded"""
+        stmt = sqlalchemy.select(JwtRecord).where(_jwt_matches(jwt)).options(selectinload(JwtRecord.device))
         result = await self.async_session.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -219,7 +223,7 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
         stmt = (
             sqlalchemy.select(Device)
             .join(JwtRecord, Device.android_id == JwtRecord.android_id)
-            .where(JwtRecord.jwt == jwt)
+            .where(_jwt_matches(jwt))
         )
         result = await self.async_session.execute(stmt)
         return result.scalar_one_or_none()
@@ -251,7 +255,7 @@ class JwtRecordCRUDRepository(BaseCRUDRepository):
         This is useful for updating dynamic information like battery level or network type
         """
         # First get the android id from the token
-        token_stmt = sqlalchemy.select(JwtRecord.android_id).where(JwtRecord.jwt == jwt)
+        token_stmt = sqlalchemy.select(JwtRecord.android_id).where(_jwt_matches(jwt))
         token_result = await self.async_session.execute(token_stmt)
         android_id = token_result.scalar_one_or_none()
         
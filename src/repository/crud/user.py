@@ -1,3 +1,4 @@
+import asyncio
 import typing
 
 import sqlalchemy
@@ -12,6 +13,15 @@ from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNot
 from src.utilities.exceptions.password import PasswordDoesNotMatch
 
 
+def _generate_salted_password_hash(password: str) -> tuple[str, str]:
+    """
+    Generate a new Bcrypt salt and the Argon2 hash of the salted password. Both steps are CPU-bound,
+    so callers run this in a worker thread to keep the event loop free.
+    """
+    hash_salt = pwd_generator.generate_salt
+    return hash_salt, pwd_generator.generate_hashed_password(hash_salt=hash_salt, new_password=password)
+
+
 class UserCRUDRepository(BaseCRUDRepository):
     async def create_user(self, user_create: UserInCreate) -> User:
         new_user = User(
@@ -21,12 +31,9 @@ class UserCRUDRepository(BaseCRUDRepository):
             user_type=user_create.user_type.value if user_create.user_type else UserTypeEnum.CONSUMER.value
         )
 
-        new_user.set_hash_salt(hash_salt=pwd_generator.generate_salt)
-        new_user.set_hashed_password(
-            hashed_password=pwd_generator.generate_hashed_password(
-                hash_salt=new_user.hash_salt, new_password=user_create.password
-            )
-        )
+        hash_salt, hashed_password = await asyncio.to_thread(_generate_salted_password_hash, user_create.password)
+        new_user.set_hash_salt(hash_salt=hash_salt)
+        new_user.set_hashed_password(hashed_password=hashed_password)
 
         self.async_session.add(instance=new_user)
         await self.async_session.commit()
@@ -34,10 +41,24 @@ class UserCRUDRepository(BaseCRUDRepository):
 
         return new_user
 
-    async def read_users(self) -> typing.Sequence[User]:
-        stmt = sqlalchemy.select(User)
+    async def read_users(self) -> typing.Sequence[sqlalchemy.Row]:
+        """
+        Select only the columns the user listing renders, skipping the password hash and salt.
+        Rows expose the columns as attributes, the same way the `User` entity does.
+        """
+        stmt = sqlalchemy.select(
+            User.id,
+            User.username,
+            User.email,
+            User.user_type,
+            User.is_verified,
+            User.is_active,
+            User.is_logged_in,
+            User.created_at,
+            User.updated_at,
+        )
         query = await self.async_session.execute(statement=stmt)
-        return query.scalars().all()
+        return query.all()
 
     async def read_user_by_id(self, id: int) -> User:
         stmt = sqlalchemy.select(User).where(User.id == id)
@@ -71,18 +92,24 @@ class UserCRUDRepository(BaseCRUDRepository):
             User.username == user_login.username
         )
         query = await self.async_session.execute(statement=stmt)
-        db_user = query.scalar()
+        db_user = query.scalar_one_or_none()
 
         if not db_user:
             raise EntityDoesNotExist("Wrong username or wrong email!")
 
-        if not pwd_generator.is_password_authenticated(hash_salt=db_user.hash_salt, password=user_login.password, hashed_password=db_user.hashed_password):  # type: ignore
+        is_password_authenticated = await asyncio.to_thread(
+            pwd_generator.is_password_authenticated,
+            hash_salt=db_user.hash_salt,
+            password=user_login.password,
+            hashed_password=db_user.hashed_password,
+        )
+        if not is_password_authenticated:  # type: ignore
             raise PasswordDoesNotMatch("Password does not match!")
 
         return db_user  # type: ignore
 
     async def update_user_by_id(self, id: int, user_update: UserInUpdate) -> User:
-        new_user_data = user_update.dict()
+        new_user_data = user_update.model_dump()
 
         select_stmt = sqlalchemy.select(User).where(User.id == id)
         query = await self.async_session.execute(statement=select_stmt)
@@ -103,8 +130,9 @@ class UserCRUDRepository(BaseCRUDRepository):
             update_stmt = update_stmt.values(user_type=new_user_data["user_type"].value)
 
         if new_user_data["password"]:
-            update_user.set_hash_salt(hash_salt=pwd_generator.generate_salt)  # type: ignore
-            update_user.set_hashed_password(hashed_password=pwd_generator.generate_hashed_password(hash_salt=update_user.hash_salt, new_password=new_user_data["password"]))  # type: ignore
+            hash_salt, hashed_password = await asyncio.to_thread(_generate_salted_password_hash, new_user_data["password"])
+            update_user.set_hash_salt(hash_salt=hash_salt)  # type: ignore
+            update_user.set_hashed_password(hashed_password=hashed_password)  # type: ignore
 
         await self.async_session.execute(statement=update_stmt)
         await self.async_session.commit()
@@ -145,4 +173,16 @@ class UserCRUDRepository(BaseCRUDRepository):
         if not credential_verifier.is_email_available(email=db_email):
             raise EntityAlreadyExists(f"The email `{email}` is already registered!")  # type: ignore
 
-        return True
\ No newline at end of file
+        return True
+
+    async def check_username_or_email_taken(self, username: str, email: str) -> tuple[bool, bool]:
+        stmt = sqlalchemy.select(User.username, User.email).where(
+            sqlalchemy.or_(User.username == username, User.email == email)
+        )
+        query = await self.async_session.execute(statement=stmt)
+        rows = query.all()
+
+        is_username_taken = any(row.username == username for row in rows)
+        is_email_taken = any(row.email == email for row in rows)
+
+        return is_username_taken, is_email_taken
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 import loguru
+import sqlalchemy
 from sqlalchemy import event
 from sqlalchemy.dialects.postgresql.asyncpg import AsyncAdapt_asyncpg_connection
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSessionTransaction
@@ -13,41 +14,27 @@ from src.repository.base import Base
 def inspect_db_server_on_connection(
     db_api_connection: AsyncAdapt_asyncpg_connection, connection_record: _ConnectionRecord
 ) -> None:
-    loguru.logger.info(f"New DB API Connection ---\n {db_api_connection}")
-    loguru.logger.info(f"Connection Record ---\n {connection_record}")
+    # Lazy so the connection reprs are only built when INFO is actually emitted
+    loguru.logger.opt(lazy=True).info("New DB API Connection ---\n {}", lambda: db_api_connection)
+    loguru.logger.opt(lazy=True).info("Connection Record ---\n {}", lambda: connection_record)
 
 
 @event.listens_for(target=async_db.async_engine.sync_engine, identifier="close")
 def inspect_db_server_on_close(
     db_api_connection: AsyncAdapt_asyncpg_connection, connection_record: _ConnectionRecord
 ) -> None:
-    loguru.logger.info(f"Closing DB API Connection ---\n {db_api_connection}")
-    loguru.logger.info(f"Closed Connection Record ---\n {connection_record}")
+    loguru.logger.opt(lazy=True).info("Closing DB API Connection ---\n {}", lambda: db_api_connection)
+    loguru.logger.opt(lazy=True).info("Closed Connection Record ---\n {}", lambda: connection_record)
 
 
 async def initialize_db_tables(connection: AsyncConnection) -> None:
     loguru.logger.info("Database Table Creation --- Initializing . . .")
 
-    await connection.run_sync(Base.metadata.drop_all)
-    await connection.run_sync(Base.metadata.create_all)
-    from sqlalchemy import insert
+    existing_tables = await connection.run_sync(lambda sync_conn: set(sqlalchemy.inspect(sync_conn).get_table_names()))
+    needed_tables = {table.name for table in Base.metadata.sorted_tables}
 
-    loguru.logger.info("Database Table Creation --- Successfully Initialized!")
-
-
-    loguru.logger.info("Database Table Creation --- Initializing . . .")
-
-    table_exists = False
-    for table in Base.metadata.sorted_tables:
-        exists = await connection.run_sync(
-            lambda sync_conn: sync_conn.dialect.has_table(sync_conn, table.name)
-        )
-        if exists:
-            table_exists = True
-            break
-
-    if not table_exists:
-        loguru.logger.info("No tables found - Creating tables...")
+    if needed_tables - existing_tables:
+        loguru.logger.info("Missing tables found - Creating tables...")
         await connection.run_sync(Base.metadata.create_all)
     else:
         loguru.logger.info("Tables already exist - Skipping creation")
@@ -0,0 +1,47 @@
+"""index jwt_record by token hash and expires_at
+
+Revision ID: c9d2f4a6b8e1
+Revises: a3b6d8c5e7f9
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c9d2f4a6b8e1"
+down_revision = "a3b6d8c5e7f9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add the hash column and backfill it the same way compute_jwt_hash does.
+    # Tables built by create_all may already have the column, so only fill in what is missing
+    op.execute("ALTER TABLE jwt_record ADD COLUMN IF NOT EXISTS jwt_hash BIGINT")
+    op.execute("""
+    UPDATE jwt_record
+    SET jwt_hash = ('x' || substr(md5(jwt), 1, 16))::bit(64)::bigint
+    WHERE jwt_hash IS NULL
+    """)
+    op.alter_column("jwt_record", "jwt_hash", nullable=False)
+    # Not unique: lookups also compare the raw token, so a hash collision must not reject an insert
+    op.execute("CREATE INDEX IF NOT EXISTS ix_jwt_record_jwt_hash ON jwt_record (jwt_hash)")
+
+    # The raw token no longer needs its own indexes, lookups go through jwt_hash.
+    # Depending on how the table was created it has a unique index, a unique constraint or both
+    op.execute("DROP INDEX IF EXISTS ix_jwt_record_jwt")
+    op.execute("ALTER TABLE jwt_record DROP CONSTRAINT IF EXISTS jwt_record_jwt_key")
+
+    # BRIN on expires_at keeps expiry sweeps cheap without a full btree
+    op.execute("CREATE INDEX IF NOT EXISTS ix_jwt_expires_brin ON jwt_record USING brin (expires_at)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jwt_expires_brin")
+
+    op.create_index("ix_jwt_record_jwt", "jwt_record", ["jwt"], unique=True)
+
+    op.execute("DROP INDEX IF EXISTS ix_jwt_record_jwt_hash")
+    op.drop_column("jwt_record", "jwt_hash")
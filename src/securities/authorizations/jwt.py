@@ -1,7 +1,12 @@
+import base64
+import calendar
 import datetime
+import hashlib
+import hmac
 import uuid
 from typing import Tuple, List, Dict, Any, Optional
 
+import orjson
 import pydantic
 from jose import jwt as jose_jwt, JWTError as JoseJWTError
 
@@ -13,9 +18,32 @@ from src.utilities.exceptions.exceptions import SecurityException
 from src.utilities.logging.logger import logger
 
 
+def _base64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
 class JWTGenerator:
     def __init__(self):
-        pass
+        # HS256 tokens are signed in-process; the header segment never changes, so encode it once
+        self._is_hs256: bool = settings.JWT_ALGORITHM == "HS256"
+        self._header_segment: bytes = _base64url_encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+        self._secret_key: bytes = settings.JWT_SECRET_KEY.encode("utf-8")
+        # Keyed HMAC state, copied per token so the key padding is only computed once
+        self._hmac_template: hmac.HMAC = hmac.new(self._secret_key, digestmod=hashlib.sha256)
+
+        # OpenSSL's SHA-256 uses the CPU's SHA extensions; CPython's builtin fallback is several times slower
+        if self._is_hs256 and type(hashlib.sha256()).__module__ != "_hashlib":
+            logger.warning("hashlib.sha256 is not backed by OpenSSL, JWT signing will be slower")
+
+    def _encode_hs256(self, claims: dict[str, Any]) -> str:
+        """
+        Encode and sign the claims as an HS256 JWT, byte-compatible with `jose_jwt.decode`.
+        """
+        signing_input = self._header_segment + b"." + _base64url_encode(orjson.dumps(claims))
+        signer = self._hmac_template.copy()
+        signer.update(signing_input)
+        signature = signer.digest()
+        return (signing_input + b"." + _base64url_encode(signature)).decode("ascii")
 
     def _generate_jwt_token(
         self,
@@ -45,20 +73,28 @@ class JWTGenerator:
         # Use provided subject or default
         if not subject:
             subject = settings.JWT_SUBJECT
-        to_encode.update(JWToken(exp=expire, sub=subject, jti=jti).dict())
+        to_encode.update(JWToken(exp=expire, sub=subject, jti=jti).model_dump())
+
+        if self._is_hs256:
+            # Same NumericDate conversion jose applies to `exp`
+            to_encode["exp"] = calendar.timegm(expire.utctimetuple())
+            return self._encode_hs256(claims=to_encode)
 
         return jose_jwt.encode(to_encode, key=settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
-    def generate_access_token(self, user: User, device_info: DeviceInfo) -> Tuple[str, int, uuid.UUID]:
+    def generate_access_token(
+        self, user: User, device_info: DeviceInfo | None = None
+    ) -> Tuple[str, int, uuid.UUID | None]:
         """
         Generate an access token with device information
         Returns the token, expiration time in seconds, and the device ID
+        Tokens issued without device information carry no device claim
         """
         if not user:
             raise EntityDoesNotExist("Cannot generate JWT token without User entity!")
 
         # If no device ID provided, generate one
-        if not device_info.device_id:
+        if device_info and not device_info.device_id:
             device_info.device_id = str(uuid.uuid4())
 
         # Calculate expiration
@@ -72,17 +108,18 @@ class JWTGenerator:
             email=user.email, 
             user_type=user.user_type,
             user_id=user.id
-        ).dict()
+        ).model_dump()
         
         # Add device info to payload
-        token_data.update({
-            "device": {
-                "id": device_info.device_id,
-                "name": device_info.device_name,
-                "type": device_info.device_type,
-                "hash": device_info.device_hash
-            }
-        })
+        if device_info:
+            token_data.update({
+                "device": {
+                    "id": device_info.device_id,
+                    "name": device_info.device_name,
+                    "type": device_info.device_type,
+                    "hash": device_info.device_hash
+                }
+            })
 
         # Generate token with unique JWT ID
         jti = str(uuid.uuid4())
@@ -93,7 +130,7 @@ class JWTGenerator:
             subject=settings.JWT_SUBJECT
         )
 
-        return token, expiration_seconds, device_info.android_id
+        return token, expiration_seconds, device_info.android_id if device_info else None
         
     def generate_refresh_token(self, user: User, device_info: DeviceInfo) -> Tuple[str, int, uuid.UUID]:
         """
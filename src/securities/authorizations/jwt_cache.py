@@ -0,0 +1,40 @@
+import hashlib
+import threading
+
+from cachetools import TTLCache
+
+from src.config.manager import settings
+from src.models.db.user import User
+from src.securities.authorizations.jwt import jwt_generator
+
+# Reuse a token for at most 9 minutes, and never past half of the token lifetime
+JWT_CACHE_TTL: int = min(540, settings.JWT_ACCESS_TOKEN_EXPIRATION_TIME * 60 // 2)
+JWT_CACHE_MAXSIZE: int = 10000
+
+_token_cache: TTLCache = TTLCache(maxsize=JWT_CACHE_MAXSIZE, ttl=JWT_CACHE_TTL)
+_token_cache_lock: threading.Lock = threading.Lock()
+
+
+def _build_token_cache_key(user: User) -> bytes:
+    """
+    Hash every claim that ends up in the token so a changed user never gets a stale token.
+    """
+    key_material = f"{user.id}|{user.username}|{user.email}|{user.user_type}".encode("utf-8")
+    return hashlib.blake2b(key_material, digest_size=16).digest()
+
+
+def get_cached_access_token(user: User) -> str:
+    """
+    Return a device-less access token for the user, signing a new one only on a cache miss.
+    """
+    cache_key = _build_token_cache_key(user=user)
+
+    with _token_cache_lock:
+        access_token = _token_cache.get(cache_key)
+
+    if access_token is None:
+        access_token, _, _ = jwt_generator.generate_access_token(user=user)
+        with _token_cache_lock:
+            _token_cache[cache_key] = access_token
+
+    return access_token
@@ -1,11 +1,13 @@
+import typing
+
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from src.utilities.exceptions.database import EntityAlreadyExists
+from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 
 
 async def general_exception_handler(request: Request, exc: Exception):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "data": [],
@@ -58,7 +60,7 @@ class InternalServerErrorException(Exception):
 
 # Exception handlers
 async def user_not_found_exception_handler(request: Request, exc: UserNotFoundException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "data": [],
@@ -69,7 +71,7 @@ async def user_not_found_exception_handler(request: Request, exc: UserNotFoundEx
     )
 
 async def user_already_exists_exception_handler(request: Request, exc: UserAlreadyExistsException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "data": [],
@@ -80,7 +82,7 @@ async def user_already_exists_exception_handler(request: Request, exc: UserAlrea
     )
 
 async def invalid_credentials_exception_handler(request: Request, exc: InvalidCredentialsException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "data": [],
@@ -91,7 +93,7 @@ async def invalid_credentials_exception_handler(request: Request, exc: InvalidCr
     )
 
 async def authorization_header_exception_handler(request: Request, exc: AuthorizationHeaderException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "data": [],
@@ -103,7 +105,7 @@ async def authorization_header_exception_handler(request: Request, exc: Authoriz
     )
 
 async def security_exception_handler(request: Request, exc: SecurityException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_401_UNAUTHORIZED,
         content={
             "data": [],
@@ -114,7 +116,7 @@ async def security_exception_handler(request: Request, exc: SecurityException):
     )
 
 async def entity_does_not_exist_exception_handler(request: Request, exc: EntityDoesNotExistException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
             "data": [],
@@ -125,7 +127,7 @@ async def entity_does_not_exist_exception_handler(request: Request, exc: EntityD
     )
 
 async def internal_server_error_exception_handler(request: Request, exc: InternalServerErrorException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "data": [],
@@ -136,7 +138,7 @@ async def internal_server_error_exception_handler(request: Request, exc: Interna
     )
 
 async def entity_already_exists_exception_handler(request: Request, exc: EntityAlreadyExists):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
             "data": [],
@@ -146,15 +148,19 @@ async def entity_already_exists_exception_handler(request: Request, exc: EntityA
         },
     )
 
-from fastapi import FastAPI
+# Registered in order; the catch-all Exception handler stays last
+EXCEPTION_HANDLERS: list[tuple[type[Exception], typing.Callable]] = [
+    (UserNotFoundException, user_not_found_exception_handler),
+    (UserAlreadyExistsException, user_already_exists_exception_handler),
+    (InvalidCredentialsException, invalid_credentials_exception_handler),
+    (AuthorizationHeaderException, authorization_header_exception_handler),
+    (SecurityException, security_exception_handler),
+    (EntityDoesNotExist, entity_does_not_exist_exception_handler),
+    (EntityAlreadyExists, entity_already_exists_exception_handler),
+    (InternalServerErrorException, internal_server_error_exception_handler),
+    (Exception, general_exception_handler),
+]
 
 def register_exception_handlers(app: FastAPI):
-    app.add_exception_handler(UserNotFoundException, user_not_found_exception_handler)
-    app.add_exception_handler(UserAlreadyExistsException, user_already_exists_exception_handler)
-    app.add_exception_handler(InvalidCredentialsException, invalid_credentials_exception_handler)
-    app.add_exception_handler(AuthorizationHeaderException, authorization_header_exception_handler)
-    app.add_exception_handler(SecurityException, security_exception_handler)
-    app.add_exception_handler(EntityDoesNotExistException, entity_does_not_exist_exception_handler)
-    app.add_exception_handler(EntityAlreadyExists, entity_already_exists_exception_handler)
-    app.add_exception_handler(InternalServerErrorException, internal_server_error_exception_handler)
-    app.add_exception_handler(Exception, general_exception_handler)
+    for exception_class, handler in EXCEPTION_HANDLERS:
+        app.add_exception_handler(exception_class, handler)
@@ -2,6 +2,8 @@ from loguru import logger
 import sys
 import os
 
+from src.config.manager import settings
+
 def setup_logger():
     log_dir = 'src/logs'
     os.makedirs(log_dir, exist_ok=True)
@@ -14,6 +16,19 @@ def setup_logger():
         "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
     )
 
+    if settings.SERVER_WORKERS > 1:
+        # Several worker processes would each run their own enqueue queue against the same file,
+        # so log to stderr instead and let the process supervisor (docker, systemd) aggregate it
+        logger.add(
+            sys.stderr,
+            level="INFO",
+            format=log_format,
+            colorize=None, # Only colorize when stderr is a terminal, not in docker/journald logs
+            backtrace=True,
+            diagnose=False # Variable values in tracebacks can include secrets, keep them out of aggregated logs
+        )
+        return logger
+
     # Configure console logging
     logger.add(
         sys.stdout,
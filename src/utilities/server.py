@@ -0,0 +1,20 @@
+import importlib.util
+import sys
+
+
+def select_event_loop() -> str:
+    """
+    Use uvloop when it is installed (it does not support Windows), otherwise let uvicorn pick.
+    """
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    return "auto"
+
+
+def select_http_protocol() -> str:
+    """
+    Use httptools when it is installed, otherwise let uvicorn pick.
+    """
+    if importlib.util.find_spec("httptools") is not None:
+        return "httptools"
+    return "auto"
@@ -0,0 +1,30 @@
+import asyncio
+import typing
+
+T = typing.TypeVar("T")
+
+_in_flight: dict[typing.Hashable, asyncio.Future] = {}
+
+
+def _release(key: typing.Hashable, task: asyncio.Future) -> None:
+    if _in_flight.get(key) is task:
+        del _in_flight[key]
+    # Avoid "exception was never retrieved" warnings when every caller went away
+    if not task.cancelled():
+        task.exception()
+
+
+async def run_once(key: typing.Hashable, coro_factory: typing.Callable[[], typing.Awaitable[T]]) -> T:
+    """
+    Run `coro_factory()` for a key, sharing its result with every caller that asks for the same key while it runs.
+
+    The work runs in its own task and every caller, the first one included, awaits it through a shield, so
+    cancelling one caller never cancels the call the others are waiting on.
+    The key is released as soon as the call finishes, so later callers trigger a fresh run.
+    """
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _in_flight[key] = task
+        task.add_done_callback(lambda done: _release(key, done))
+    return await asyncio.shield(task)
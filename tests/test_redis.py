@@ -0,0 +1,36 @@
+from src.cache.redis import redis_manager
+
+
+def test_tagged_values_round_trip() -> None:
+    assert redis_manager._deserialize(redis_manager._serialize("Sunday")) == b"Sunday"
+    assert redis_manager._deserialize(redis_manager._serialize(b"Jupiter")) == b"Jupiter"
+    for value in ({"day": "Sunday"}, [1, 2, 3], 42, None):
+        assert redis_manager._deserialize(redis_manager._serialize(value)) == value
+
+
+def test_tagged_values_round_trip_with_decoded_responses() -> None:
+    assert redis_manager._deserialize(redis_manager._serialize("Sunday").decode("utf-8")) == "Sunday"
+    assert redis_manager._deserialize(redis_manager._serialize({"day": "Sunday"}).decode("utf-8")) == {"day": "Sunday"}
+
+
+def test_legacy_values_starting_with_tag_letters_are_not_truncated() -> None:
+    assert redis_manager._deserialize(b"Sunday") == b"Sunday"
+    assert redis_manager._deserialize("Sunday") == "Sunday"
+    assert redis_manager._deserialize(b"Jupiter") == b"Jupiter"
+    assert redis_manager._deserialize("Jupiter") == "Jupiter"
+
+
+def test_legacy_json_values_are_decoded() -> None:
+    assert redis_manager._deserialize(b'{"day": "Sunday"}') == {"day": "Sunday"}
+    assert redis_manager._deserialize('["Jupiter"]') == ["Jupiter"]
+    assert redis_manager._deserialize(b"{not json") == b"{not json"
+
+
+async def test_cacheable_get_returns_a_fresh_object_per_hit() -> None:
+    redis_manager._l1["test:l1"] = redis_manager._serialize({"days": ["Sunday"]})
+    try:
+        first = await redis_manager.get("test:l1", cacheable=True)
+        first["days"].append("Monday")
+        assert await redis_manager.get("test:l1", cacheable=True) == {"days": ["Sunday"]}
+    finally:
+        redis_manager._l1.pop("test:l1", None)